@@ -9,12 +9,14 @@ The app uses Zerodha if configured via environment variables, otherwise falls ba
 """
 import os
 import streamlit as st
+import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
-from datetime import datetime
+from datetime import date, datetime, time, timedelta
 
-from indicators import rsi, macd, moving_averages, generate_simple_signal
+from indicators import IndicatorStream, generate_simple_signal
 from data_provider import fetch_data
+from charting import line_trace
 
 st.set_page_config(page_title="Automated Trade Recommendation", layout="wide")
 
@@ -33,11 +35,43 @@ show_macd = st.sidebar.checkbox("MACD", True)
 show_sma = st.sidebar.checkbox("SMA (short/long)", True)
 show_bb = st.sidebar.checkbox("Bollinger Bands", True)
 
-def run_analysis(symbol, period_days, interval, use_zerodha, show_rsi, show_macd, show_sma, show_bb):
-    """Fetches data and displays the analysis and charts."""
+
+def history_start(symbol, period_days, interval, use_zerodha):
+    """Fetch start pinned per series, so refetches append bars instead of sliding the window.
+
+    A sliding start changes the first bar on every refetch, which would force the
+    indicator stream into a full recomputation.
+    """
+    key = (symbol, period_days, interval, use_zerodha)
+    pinned = st.session_state.get("history_start")
+    if pinned is None or pinned[0] != key:
+        # midnight, so every session on the same day shares the st.cache_data key for the fetch
+        pinned = (key, datetime.combine(date.today() - timedelta(days=period_days), time.min))
+        st.session_state["history_start"] = pinned
+    return pinned[1]
+
+
+def compute_indicators(prices, key):
+    """Return the indicator frame for prices, computing only bars appended since the last run.
+
+    Only the stream for the current key is kept in session state; switching symbol,
+    interval or source starts a fresh one.
+    """
+    cached = st.session_state.get("indicator_cache")
+    if cached is None or cached[0] != key:
+        cached = (key, IndicatorStream())
+        st.session_state["indicator_cache"] = cached
+    # update() returns a view of the stream's buffer, which the next update rewrites in place;
+    # the results frame is cached for toggle-only redraws, so it must own its data
+    return cached[1].update(prices).copy()
+
+
+def load_results(symbol, period_days, interval, use_zerodha):
+    """Fetches data and computes every indicator; returns the combined results frame."""
     with st.spinner(f"Fetching data for {symbol}..."):
         try:
-            df = fetch_data(symbol, period_days=period_days, interval=interval, use_zerodha=use_zerodha)
+            start = history_start(symbol, period_days, interval, use_zerodha)
+            df = fetch_data(symbol, period_days=period_days, interval=interval, use_zerodha=use_zerodha, start=start)
         except Exception as e:
             st.error(f"Failed to fetch data: {e}")
             st.stop()
@@ -54,77 +88,89 @@ def run_analysis(symbol, period_days, interval, use_zerodha, show_rsi, show_macd
             st.error("No 'close' column in fetched data.")
             st.stop()
 
-    df = df.sort_index()
-    prices = df["close"].astype(float)
+    # Providers already deliver sorted float data; only copy when they don't
+    if not df.index.is_monotonic_increasing:
+        df = df.sort_index()
+    prices = df["close"] if df["close"].dtype.kind == "f" else df["close"].astype(np.float64, copy=False)
 
     # Compute indicators
     results = pd.DataFrame(index=prices.index)
     results["close"] = prices
     # Also need open, high, low for candlestick
     results = results.join(df[['open', 'high', 'low']])
+    # All indicators are kept so that toggling one on later needs no recomputation
+    results = results.join(compute_indicators(prices, (symbol, interval, use_zerodha)))
+
+    # Warm-up NaNs are left in place: Plotly skips them per trace, so no dropna() copy is needed
+    if len(results) < 2:
+        st.warning("Not enough data to generate a signal after indicator calculation.")
+        st.stop()
+    return results
 
 
+def run_analysis(symbol, period_days, interval, use_zerodha, show_rsi, show_macd, show_sma, show_bb):
+    """Fetches data and displays the analysis and charts."""
+    data_inputs = (symbol, period_days, interval, use_zerodha)
+    results = load_results(*data_inputs)
+    st.session_state['last_inputs'] = data_inputs
+    st.session_state['last_results'] = results
+    render_analysis(symbol, results, show_rsi, show_macd, show_sma, show_bb)
+    st.session_state['analysis_complete'] = True
+
+
+def render_analysis(symbol, results, show_rsi, show_macd, show_sma, show_bb):
+    """Displays the suggestion and charts for the enabled indicators of a results frame."""
+    shown = ["close"]
     if show_rsi:
-        results["rsi"] = rsi(prices)
+        shown.append("rsi")
     if show_macd:
-        macd_df = macd(prices)
-        results = results.join(macd_df)
+        shown += ["macd", "signal", "hist"]
     if show_sma:
-        sma_df = moving_averages(prices)
-        results = results.join(sma_df)
+        shown += ["sma_short", "sma_long"]
     if show_bb:
-        from indicators import bollinger_bands
-        bb_df = bollinger_bands(prices)
-        results = results.join(bb_df)
-
-    # Drop rows with NaNs for plotting convenience
-    plot_df = results.dropna()
-
-    if len(plot_df) < 2:
-        st.warning("Not enough data to generate a signal after indicator calculation.")
-        st.stop()
+        shown += ["bb_ma", "bb_upper", "bb_lower"]
 
-    # Generate suggestion
-    suggestion, reason = generate_simple_signal(plot_df)
+    # Generate suggestion from the enabled indicators only (the signal reads the last two rows)
+    suggestion, reason = generate_simple_signal(results.iloc[-2:][shown])
 
     # Layout: top KPIs and charts
     col1, col2 = st.columns([3, 1])
     with col1:
-        st.subheader(f"{symbol} — Last Close: {prices.iloc[-1]:.2f}")
-        
-        # Price chart
-        fig_price = go.Figure()
-        fig_price.add_trace(go.Candlestick(x=plot_df.index,
-                                           open=plot_df['open'], high=plot_df['high'],
-                                           low=plot_df['low'], close=plot_df['close'],
-                                           name='Price'))
-        if show_sma and "sma_short" in plot_df.columns:
-            fig_price.add_trace(go.Scatter(x=plot_df.index, y=plot_df["sma_short"], name="SMA Short", line=dict(color="orange", width=1)))
-            fig_price.add_trace(go.Scatter(x=plot_df.index, y=plot_df["sma_long"], name="SMA Long", line=dict(color="blue", width=1)))
+        st.subheader(f"{symbol} — Last Close: {results['close'].iloc[-1]:.2f}")
         
-        if show_bb and {"bb_upper", "bb_lower"}.issubset(plot_df.columns):
-            fig_price.add_trace(go.Scatter(x=plot_df.index, y=plot_df['bb_upper'], name='BB Upper', line=dict(color='gray', width=1, dash='dash')))
-            fig_price.add_trace(go.Scatter(x=plot_df.index, y=plot_df['bb_lower'], name='BB Lower', line=dict(color='gray', width=1, dash='dash')))
-
-        fig_price.update_layout(title="Price and Overlays", xaxis_rangeslider_visible=False)
+        # Price chart: collect traces first and build each figure once
+        price_traces = [go.Candlestick(x=results.index,
+                                       open=results['open'], high=results['high'],
+                                       low=results['low'], close=results['close'],
+                                       name='Price')]
+        if show_sma:
+            price_traces.append(line_trace(results["sma_short"], name="SMA Short", line=dict(color="orange", width=1)))
+            price_traces.append(line_trace(results["sma_long"], name="SMA Long", line=dict(color="blue", width=1)))
+
+        if show_bb:
+            price_traces.append(line_trace(results['bb_upper'], name='BB Upper', line=dict(color='gray', width=1, dash='dash')))
+            price_traces.append(line_trace(results['bb_lower'], name='BB Lower', line=dict(color='gray', width=1, dash='dash')))
+
+        fig_price = go.Figure(data=price_traces,
+                              layout=go.Layout(title="Price and Overlays", xaxis_rangeslider_visible=False))
         st.plotly_chart(fig_price, use_container_width=True)
 
         # RSI chart
-        if show_rsi and "rsi" in plot_df.columns:
-            fig_rsi = go.Figure()
-            fig_rsi.add_trace(go.Scatter(x=plot_df.index, y=plot_df["rsi"], name="RSI", line=dict(color="purple")))
-            fig_rsi.update_layout(title="Relative Strength Index (RSI)", yaxis_title="RSI")
+        if show_rsi:
+            fig_rsi = go.Figure(data=[line_trace(results["rsi"], name="RSI", line=dict(color="purple"))],
+                                layout=go.Layout(title="Relative Strength Index (RSI)", yaxis_title="RSI"))
             fig_rsi.add_hline(y=70, line_dash="dash", line_color="red")
             fig_rsi.add_hline(y=30, line_dash="dash", line_color="green")
             st.plotly_chart(fig_rsi, use_container_width=True)
 
         # MACD chart
-        if show_macd and {"macd", "signal"}.issubset(plot_df.columns):
-            fig_macd = go.Figure()
-            fig_macd.add_trace(go.Bar(x=plot_df.index, y=plot_df["hist"], name="MACD Hist", marker_color="gray"))
-            fig_macd.add_trace(go.Scatter(x=plot_df.index, y=plot_df["macd"], name="MACD", line=dict(color="green")))
-            fig_macd.add_trace(go.Scatter(x=plot_df.index, y=plot_df["signal"], name="Signal", line=dict(color="red")))
-            fig_macd.update_layout(title="MACD")
+        if show_macd:
+            macd_traces = [
+                go.Bar(x=results.index, y=results["hist"], name="MACD Hist", marker_color="gray"),
+                line_trace(results["macd"], name="MACD", line=dict(color="green")),
+                line_trace(results["signal"], name="Signal", line=dict(color="red")),
+            ]
+            fig_macd = go.Figure(data=macd_traces, layout=go.Layout(title="MACD"))
             st.plotly_chart(fig_macd, use_container_width=True)
 
     with col2:
@@ -134,10 +180,8 @@ def run_analysis(symbol, period_days, interval, use_zerodha, show_rsi, show_macd
 
         st.markdown("---")
         st.write("Recent indicator values:")
-        display_cols = [c for c in ["close", "rsi", "macd", "signal", "sma_short", "sma_long", "bb_lower", "bb_upper"] if c in plot_df.columns]
-        st.dataframe(plot_df[display_cols].tail(5).style.format("{:.2f}"))
-
-    st.session_state['analysis_complete'] = True
+        display_cols = [c for c in ["close", "rsi", "macd", "signal", "sma_short", "sma_long", "bb_lower", "bb_upper"] if c in shown]
+        st.dataframe(results.iloc[-5:][display_cols].style.format("{:.2f}"))
 
 # --- Main App Logic ---
 
@@ -150,5 +194,8 @@ if st.sidebar.button("Fetch & Analyze", type="primary"):
 elif not st.session_state['analysis_complete']:
     # Automatically run for the default symbol on the first load
     run_analysis(symbol, period_days, interval, use_zerodha, show_rsi, show_macd, show_sma, show_bb)
+elif st.session_state.get('last_inputs') == (symbol, period_days, interval, use_zerodha):
+    # Only display toggles changed: redraw from the cached results without fetching or recomputing
+    render_analysis(symbol, st.session_state['last_results'], show_rsi, show_macd, show_sma, show_bb)
 else:
     st.info("Welcome! Change the settings in the sidebar and click 'Fetch & Analyze' to update the view.")
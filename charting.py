@@ -0,0 +1,76 @@
+"""
+Chart helpers: WebGL line traces with LTTB downsampling for long series.
+"""
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+from numba import njit
+
+# Line traces longer than this are downsampled before being sent to the browser
+MAX_LINE_POINTS = 5000
+
+
+@njit(cache=True)
+def _lttb_nb(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """Largest-Triangle-Three-Buckets: indices of ``n_out`` points that preserve the line's shape.
+
+    The first and last points are always kept; each bucket in between contributes the
+    point forming the largest triangle with the previously kept point and the average
+    of the next bucket.
+    """
+    n = x.shape[0]
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    idx = np.empty(n_out, dtype=np.int64)
+    idx[0] = 0
+    idx[n_out - 1] = n - 1
+    every = (n - 2) / (n_out - 2)
+    a = 0
+    for i in range(n_out - 2):
+        avg_start = int((i + 1) * every) + 1
+        avg_end = min(int((i + 2) * every) + 1, n)
+        avg_x = 0.0
+        avg_y = 0.0
+        for j in range(avg_start, avg_end):
+            avg_x += x[j]
+            avg_y += y[j]
+        count = avg_end - avg_start
+        avg_x /= count
+        avg_y /= count
+
+        best = -1.0
+        best_j = int(i * every) + 1
+        for j in range(int(i * every) + 1, int((i + 1) * every) + 1):
+            area = abs((x[a] - avg_x) * (y[j] - y[a]) - (x[a] - x[j]) * (avg_y - y[a]))
+            if area > best:
+                best = area
+                best_j = j
+        idx[i + 1] = best_j
+        a = best_j
+    return idx
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """Positions of the points LTTB keeps when reducing (x, y) to ``n_out`` points."""
+    return _lttb_nb(np.asarray(x, dtype=np.float64), np.asarray(y, dtype=np.float64), n_out)
+
+
+def line_trace(series: pd.Series, max_points: int = MAX_LINE_POINTS, **kwargs) -> go.Scattergl:
+    """WebGL line trace for ``series``, LTTB-downsampled to ``max_points`` when longer.
+
+    NaN points (indicator warm-up) are dropped before downsampling; Plotly would skip
+    them anyway.
+    """
+    if len(series) > max_points:
+        y = series.to_numpy(dtype=np.float64)
+        valid = np.flatnonzero(~np.isnan(y))
+        if isinstance(series.index, pd.DatetimeIndex):
+            x = series.index.asi8[valid].astype(np.float64)
+        else:
+            x = valid.astype(np.float64)
+        series = series.iloc[valid[lttb_indices(x, y[valid], max_points)]]
+    return go.Scattergl(x=series.index, y=series.to_numpy(), **kwargs)
+
+
+# Compile (or load from cache) at import so the first chart render skips the JIT
+_lttb_nb(np.arange(8.0), np.arange(8.0), 4)
@@ -3,43 +3,72 @@ Unified data provider: tries Zerodha (if configured), otherwise falls back to yf
 """
 from typing import Optional
 import os
+import numpy as np
 import pandas as pd
 from datetime import datetime, timedelta
 import streamlit as st
 
+# Cached fetches are reused for this many seconds before hitting the network again
+CACHE_TTL_SECONDS = 300
 
-def fetch_with_yfinance(symbol: str, period_days: int = 90, interval: str = "1d") -> pd.DataFrame:
-    """Fallback data fetch using yfinance (no API keys required)."""
+
+def _downcast_ohlcv(df: pd.DataFrame) -> pd.DataFrame:
+    """Store OHLC as float32 and volume as int32 (when it fits) to halve memory traffic downstream."""
+    price_cols = [c for c in ("open", "high", "low", "close") if c in df.columns and df[c].dtype != np.float32]
+    if price_cols:
+        df[price_cols] = df[price_cols].astype(np.float32)
+    if "volume" in df.columns and df["volume"].dtype.kind in "iu" and not df["volume"].empty:
+        if df["volume"].max() <= np.iinfo(np.int32).max:
+            df["volume"] = df["volume"].astype(np.int32)
+    return df
+
+
+@st.cache_data(ttl=CACHE_TTL_SECONDS, show_spinner=False)
+def fetch_with_yfinance(symbol: str, period_days: int = 90, interval: str = "1d",
+                        start: Optional[datetime] = None) -> pd.DataFrame:
+    """Fallback data fetch using yfinance (no API keys required).
+
+    ``start`` overrides ``now - period_days`` so callers can pin the first bar across refetches.
+    """
     try:
         import yfinance as yf
     except Exception as e:
         raise RuntimeError("yfinance not installed. Install requirements or configure Zerodha keys.") from e
 
     end = datetime.now()
-    start = end - timedelta(days=period_days)
+    start = start or end - timedelta(days=period_days)
     ticker = yf.Ticker(symbol)
     df = ticker.history(start=start, end=end, interval=interval)
     if df.empty:
         return df
     # ensure columns: open, high, low, close, volume
-    df = df.rename(columns={"Close": "close", "Open": "open", "High": "high", "Low": "low", "Volume": "volume"})
+    df.rename(columns={"Close": "close", "Open": "open", "High": "high", "Low": "low", "Volume": "volume"}, inplace=True)
     # yfinance sometimes returns data with timezone, which can cause issues with plotly
     df.index = df.index.tz_localize(None)
-    df = df[["open", "high", "low", "close", "volume"]]
+    # drop extras (Dividends, Stock Splits, ...) in place rather than copying a column subset
+    df.drop(columns=df.columns.difference(["open", "high", "low", "close", "volume"]), inplace=True)
     df.index.name = "date"
-    return df
+    return _downcast_ohlcv(df)
 
 
-def fetch_data(symbol: str, period_days: int = 90, interval: str = "1d", use_zerodha: bool = True) -> pd.DataFrame:
+@st.cache_data(ttl=CACHE_TTL_SECONDS, show_spinner=False)
+def fetch_data(symbol: str, period_days: int = 90, interval: str = "1d", use_zerodha: bool = True,
+               start: Optional[datetime] = None) -> pd.DataFrame:
     """Fetch historical OHLC data. If Zerodha is configured and use_zerodha True, attempt it; otherwise fallback to yfinance.
 
     Symbol semantics:
     - For Zerodha you may need to pass instrument token or exchange-specific identifier.
     - For yfinance, use ticker like 'AAPL' or 'RELIANCE.NS'.
+
+    ``start`` overrides ``now - period_days``; pinning it makes refetches extend the
+    history with new bars instead of sliding the whole window forward.
+
+    Results are memoized per (symbol, period_days, interval, use_zerodha, start) for
+    CACHE_TTL_SECONDS, so reruns that only toggle display options skip the network.
     """
     if use_zerodha:
         try:
-            from .zerodha_client import ZerodhaClient
+            from zerodha_client import ZerodhaClient
             api_key = os.getenv("ZERODHA_API_KEY")
             api_secret = os.getenv("ZERODHA_API_SECRET")
             access_token = os.getenv("ZERODHA_ACCESS_TOKEN")
@@ -47,15 +76,15 @@ def fetch_data(symbol: str, period_days: int = 90, interval: str = "1d", use_zer
                 client = ZerodhaClient(api_key=api_key, api_secret=api_secret, access_token=access_token)
                 # basic date formatting
                 end = datetime.now().strftime("%Y-%m-%d")
-                start = (datetime.now() - timedelta(days=period_days)).strftime("%Y-%m-%d")
-                df = client.get_historical(symbol, start, end, interval=interval)
+                from_date = (start or datetime.now() - timedelta(days=period_days)).strftime("%Y-%m-%d")
+                df = client.get_historical(symbol, from_date, end, interval=interval)
                 # Zerodha gives OHLC, let's ensure column names are consistent
                 df = df.rename(columns={"date": "date", "open": "open", "high": "high", "low": "low", "close": "close", "volume": "volume"})
-                return df
+                return _downcast_ohlcv(df)
         except Exception as e:
             # fallback to yfinance with a gentle degradation
             st.warning(f"Could not fetch from Zerodha: {e}. Falling back to yfinance.")
             pass
 
     # fallback
-    return fetch_with_yfinance(symbol, period_days=period_days, interval=interval)
+    return fetch_with_yfinance(symbol, period_days=period_days, interval=interval, start=start)
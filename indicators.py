@@ -1,9 +1,218 @@
 """
 Technical indicators: RSI, MACD, moving averages
 """
-from typing import Tuple
+from dataclasses import dataclass, field, replace
+from functools import lru_cache
+from typing import Optional, Sequence, Tuple, Union
+import zlib
 import pandas as pd
 import numpy as np
+from numba import njit, prange
+
+# fastmath minus the nnan/ninf flags: kernels rely on NaN propagating through warm-up rows
+_FASTMATH = {"nsz", "arcp", "contract", "afn", "reassoc"}
+
+
+def _memoize_array(kernel):
+    """Memoize an ndarray kernel on the raw bytes of its input plus its parameters.
+
+    Streamlit reruns recompute indicators on identical price arrays; hashing the
+    buffer turns those repeats into dictionary hits. Cached outputs are frozen so
+    callers cannot mutate shared results.
+    """
+    @lru_cache(maxsize=32)
+    def cached(dtype: str, buf: bytes, *params):
+        out = kernel(np.frombuffer(buf, dtype=dtype), *params)
+        for arr in out if isinstance(out, tuple) else (out,):
+            arr.setflags(write=False)
+        return out
+
+    def wrapper(x: np.ndarray, *params):
+        return cached(x.dtype.str, x.tobytes(), *params)
+
+    wrapper.cache_clear = cached.cache_clear
+    return wrapper
+
+
+@njit(cache=True, fastmath=_FASTMATH)
+def _ewm_step(avg: float, old_wt: float, x: float, alpha: float):
+    """Advance an ``adjust=False`` EWMA by one sample.
+
+    Mirrors pandas' ``ewm(..., adjust=False).mean()``: the first valid sample seeds
+    the average, NaN samples hold it and decay the weight of the old value.
+    """
+    if avg != avg:
+        if x == x:
+            return x, 1.0
+        return avg, old_wt
+    old_wt *= 1.0 - alpha
+    if x == x:
+        if avg != x:
+            avg = (old_wt * avg + alpha * x) / (old_wt + alpha)
+        old_wt = 1.0
+    return avg, old_wt
+
+
+@njit(cache=True, fastmath=_FASTMATH)
+def _rsi_run(close: np.ndarray, period: int, prev: float, avg_up: float, wt_up: float,
+             avg_down: float, wt_down: float):
+    """Resumable RSI kernel using Wilder's smoothing (alpha = 1 / period).
+
+    Starts from the carried ``(prev, avg_up, wt_up, avg_down, wt_down)`` state and
+    returns the RSI values together with the state after the last sample.
+    """
+    n = close.shape[0]
+    out = np.empty(n, dtype=np.float64)
+    alpha = 1.0 / period
+    for i in range(n):
+        delta = close[i] - prev
+        prev = close[i]
+        if delta == delta:
+            up = max(delta, 0.0)
+            down = max(-delta, 0.0)
+        else:
+            up = np.nan
+            down = np.nan
+        avg_up, wt_up = _ewm_step(avg_up, wt_up, up, alpha)
+        avg_down, wt_down = _ewm_step(avg_down, wt_down, down, alpha)
+        if avg_down == 0.0:
+            rs = np.inf if avg_up > 0.0 else np.nan
+        else:
+            rs = avg_up / avg_down
+        out[i] = 100.0 - 100.0 / (1.0 + rs)
+    return out, (prev, avg_up, wt_up, avg_down, wt_down)
+
+
+@njit(cache=True, fastmath=_FASTMATH)
+def _rsi_nb(close: np.ndarray, period: int) -> np.ndarray:
+    """Single-pass RSI kernel over a full price history."""
+    return _rsi_run(close, period, np.nan, np.nan, 1.0, np.nan, 1.0)[0]
+
+
+@njit(cache=True, fastmath=_FASTMATH)
+def _macd_run(close: np.ndarray, a_fast: float, a_slow: float, a_sig: float,
+              ef: float, wf: float, es: float, ws: float, s: float, wsig: float):
+    """Resumable fused MACD kernel: fast/slow/signal EMAs in one pass over the close array.
+
+    Returns ``(macd, signal, hist)`` and the ``(ef, wf, es, ws, s, wsig)`` EMA state.
+    """
+    n = close.shape[0]
+    macd_out = np.empty(n, dtype=np.float64)
+    sig_out = np.empty(n, dtype=np.float64)
+    hist_out = np.empty(n, dtype=np.float64)
+    for i in range(n):
+        x = close[i]
+        ef, wf = _ewm_step(ef, wf, x, a_fast)
+        es, ws = _ewm_step(es, ws, x, a_slow)
+        m = ef - es
+        s, wsig = _ewm_step(s, wsig, m, a_sig)
+        macd_out[i] = m
+        sig_out[i] = s
+        hist_out[i] = m - s
+    return (macd_out, sig_out, hist_out), (ef, wf, es, ws, s, wsig)
+
+
+@njit(cache=True, fastmath=_FASTMATH)
+def _macd_nb(close: np.ndarray, a_fast: float, a_slow: float, a_sig: float):
+    """Fused MACD kernel over a full price history."""
+    return _macd_run(close, a_fast, a_slow, a_sig, np.nan, 1.0, np.nan, 1.0, np.nan, 1.0)[0]
+
+
+@njit(cache=True, fastmath=_FASTMATH)
+def _bb_nb(x: np.ndarray, w: int, k: float):
+    """Bollinger Bands from running sum / sum of squares over a fixed window.
+
+    Each step adds the incoming sample and subtracts the outgoing one, so mean and
+    sample std (ddof=1, as in pandas) come out of a single pass. Samples are shifted
+    by the first valid value to keep ``s2 - w * mean**2`` well conditioned.
+    """
+    n = x.shape[0]
+    ma = np.full(n, np.nan)
+    upper = np.full(n, np.nan)
+    lower = np.full(n, np.nan)
+    shift = np.nan
+    for i in range(n):
+        if x[i] == x[i]:
+            shift = x[i]
+            break
+    if shift != shift:
+        return ma, upper, lower
+    s = 0.0
+    s2 = 0.0
+    valid = 0
+    for i in range(n):
+        v = x[i]
+        if v == v:
+            d = v - shift
+            s += d
+            s2 += d * d
+            valid += 1
+        if i >= w:
+            old = x[i - w]
+            if old == old:
+                d = old - shift
+                s -= d
+                s2 -= d * d
+                valid -= 1
+                if valid == 0:
+                    s = 0.0
+                    s2 = 0.0
+        if valid == w:
+            mean = s / w
+            if w > 1:
+                sd = np.sqrt(max((s2 - w * mean * mean) / (w - 1), 0.0))
+            else:
+                sd = np.nan
+            ma[i] = mean + shift
+            upper[i] = ma[i] + k * sd
+            lower[i] = ma[i] - k * sd
+    return ma, upper, lower
+
+
+def _as_float_array(series: pd.Series) -> np.ndarray:
+    """Close values as a float ndarray, keeping float32 input narrow (kernels accumulate in float64)."""
+    if series.dtype == np.float32 or series.dtype == np.float64:
+        return series.to_numpy()
+    return series.to_numpy(dtype=np.float64)
+
+
+@njit(cache=True, fastmath=_FASTMATH)
+def _sma_nb(x: np.ndarray, w: int) -> np.ndarray:
+    """Simple moving average with pandas' ``min_periods=1`` semantics from a running sum.
+
+    During warm-up (and around NaNs) the sum is divided by the number of valid samples
+    in the window, so the first bars average whatever history is available.
+    """
+    n = x.shape[0]
+    out = np.empty(n, dtype=np.float64)
+    s = 0.0
+    valid = 0
+    for i in range(n):
+        v = x[i]
+        if v == v:
+            s += v
+            valid += 1
+        if i >= w:
+            old = x[i - w]
+            if old == old:
+                s -= old
+                valid -= 1
+                if valid == 0:
+                    s = 0.0
+        out[i] = s / valid if valid > 0 else np.nan
+    return out
+
+
+@njit(cache=True, fastmath=_FASTMATH)
+def _sma_pair(close: np.ndarray, short_window: int, long_window: int):
+    """Short and long simple moving averages (min_periods=1) as ndarrays."""
+    return _sma_nb(close, short_window), _sma_nb(close, long_window)
+
+
+_rsi_cached = _memoize_array(_rsi_nb)
+_macd_cached = _memoize_array(_macd_nb)
+_sma_cached = _memoize_array(_sma_pair)
+_bb_cached = _memoize_array(_bb_nb)
 
 
 def rsi(series: pd.Series, period: int = 14) -> pd.Series:
@@ -16,14 +225,8 @@ def rsi(series: pd.Series, period: int = 14) -> pd.Series:
     Returns:
         pd.Series of RSI values aligned to input index.
     """
-    delta = series.diff()
-    up = delta.clip(lower=0)
-    down = -1 * delta.clip(upper=0)
-    ma_up = up.ewm(com=period - 1, adjust=False).mean()
-    ma_down = down.ewm(com=period - 1, adjust=False).mean()
-    rs = ma_up / ma_down
-    rsi = 100 - (100 / (1 + rs))
-    return rsi
+    result = _rsi_cached(_as_float_array(series), period)
+    return pd.Series(result, index=series.index, copy=True)
 
 
 def macd(series: pd.Series, fast: int = 12, slow: int = 26, signal: int = 9) -> pd.DataFrame:
@@ -31,20 +234,17 @@ def macd(series: pd.Series, fast: int = 12, slow: int = 26, signal: int = 9) ->
 
     Returns DataFrame with columns: macd, signal, hist
     """
-    ema_fast = series.ewm(span=fast, adjust=False).mean()
-    ema_slow = series.ewm(span=slow, adjust=False).mean()
-    macd_line = ema_fast - ema_slow
-    signal_line = macd_line.ewm(span=signal, adjust=False).mean()
-    hist = macd_line - signal_line
-    df = pd.DataFrame({"macd": macd_line, "signal": signal_line, "hist": hist})
+    macd_line, signal_line, hist = _macd_cached(
+        _as_float_array(series), 2.0 / (fast + 1), 2.0 / (slow + 1), 2.0 / (signal + 1)
+    )
+    df = pd.DataFrame({"macd": macd_line, "signal": signal_line, "hist": hist}, index=series.index)
     return df
 
 
 def moving_averages(series: pd.Series, short_window: int = 9, long_window: int = 21) -> pd.DataFrame:
     """Return short and long simple moving averages."""
-    sma_short = series.rolling(window=short_window, min_periods=1).mean()
-    sma_long = series.rolling(window=long_window, min_periods=1).mean()
-    return pd.DataFrame({"sma_short": sma_short, "sma_long": sma_long})
+    sma_short, sma_long = _sma_cached(_as_float_array(series), short_window, long_window)
+    return pd.DataFrame({"sma_short": sma_short, "sma_long": sma_long}, index=series.index)
 
 
 def bollinger_bands(series: pd.Series, window: int = 20, num_std: int = 2) -> pd.DataFrame:
@@ -58,11 +258,264 @@ def bollinger_bands(series: pd.Series, window: int = 20, num_std: int = 2) -> pd
     Returns:
         pd.DataFrame with columns: 'bb_ma', 'bb_upper', 'bb_lower'.
     """
-    rolling_mean = series.rolling(window=window).mean()
-    rolling_std = series.rolling(window=window).std()
-    upper_band = rolling_mean + (rolling_std * num_std)
-    lower_band = rolling_mean - (rolling_std * num_std)
-    return pd.DataFrame({'bb_ma': rolling_mean, 'bb_upper': upper_band, 'bb_lower': lower_band})
+    rolling_mean, upper_band, lower_band = _bb_cached(_as_float_array(series), window, float(num_std))
+    return pd.DataFrame({'bb_ma': rolling_mean, 'bb_upper': upper_band, 'bb_lower': lower_band}, index=series.index)
+
+
+@njit(cache=True, parallel=True, fastmath=_FASTMATH)
+def _rsi_2d_nb(x: np.ndarray, periods: np.ndarray) -> np.ndarray:
+    """RSI for each column of ``x`` (with its own period), columns spread across cores."""
+    n, k = x.shape
+    out = np.empty((k, n), dtype=np.float64)
+    for j in prange(k):
+        out[j] = _rsi_nb(x[:, j], periods[j])
+    return out.T
+
+
+@njit(cache=True, parallel=True, fastmath=_FASTMATH)
+def _sma_2d_nb(x: np.ndarray, windows: np.ndarray) -> np.ndarray:
+    """SMA for each column of ``x`` (with its own window), columns spread across cores."""
+    n, k = x.shape
+    out = np.empty((k, n), dtype=np.float64)
+    for j in prange(k):
+        out[j] = _sma_nb(x[:, j], windows[j])
+    return out.T
+
+
+@njit(cache=True, parallel=True, fastmath=_FASTMATH)
+def _bb_2d_nb(x: np.ndarray, windows: np.ndarray, num_std: np.ndarray):
+    """Bollinger Bands for each column of ``x``, columns spread across cores."""
+    n, k = x.shape
+    ma = np.empty((k, n), dtype=np.float64)
+    upper = np.empty((k, n), dtype=np.float64)
+    lower = np.empty((k, n), dtype=np.float64)
+    for j in prange(k):
+        ma[j], upper[j], lower[j] = _bb_nb(x[:, j], windows[j], num_std[j])
+    return ma.T, upper.T, lower.T
+
+
+def _sweep_inputs(prices: Union[pd.Series, pd.DataFrame], params):
+    """Lay out prices as an (N, K) array with one parameter per column.
+
+    A Series is repeated (without copying) once per parameter value, which gives a
+    parameter sweep keyed by the parameter. A DataFrame contributes one column per
+    symbol, sharing a scalar parameter or taking one per column, keyed by column name.
+    """
+    if isinstance(prices, pd.DataFrame):
+        x = np.asfortranarray(prices.to_numpy(dtype=np.float64))
+        params = np.broadcast_to(np.asarray(params), (x.shape[1],))
+        keys = prices.columns
+    else:
+        params = np.atleast_1d(np.asarray(params))
+        close = _as_float_array(prices)
+        x = np.broadcast_to(close[:, None], (close.shape[0], params.shape[0]))
+        keys = pd.Index(params)
+    return x, np.ascontiguousarray(params), keys
+
+
+def rsi_sweep(prices: Union[pd.Series, pd.DataFrame], periods: Union[int, Sequence[int]] = 14) -> pd.DataFrame:
+    """RSI for several periods of one series, or for several symbols at once.
+
+    Args:
+        prices: Close series (sweep over ``periods``) or DataFrame with one column per symbol.
+        periods: Lookback periods; for a DataFrame either one shared period or one per column.
+
+    Returns:
+        pd.DataFrame with one RSI column per period (Series input) or per symbol (DataFrame input).
+    """
+    x, periods, keys = _sweep_inputs(prices, periods)
+    return pd.DataFrame(_rsi_2d_nb(x, periods.astype(np.int64)), index=prices.index, columns=keys)
+
+
+def sma_sweep(prices: Union[pd.Series, pd.DataFrame], windows: Union[int, Sequence[int]]) -> pd.DataFrame:
+    """Simple moving averages (min_periods=1) for several windows or several symbols; see rsi_sweep."""
+    x, windows, keys = _sweep_inputs(prices, windows)
+    return pd.DataFrame(_sma_2d_nb(x, windows.astype(np.int64)), index=prices.index, columns=keys)
+
+
+def bollinger_sweep(prices: Union[pd.Series, pd.DataFrame], windows: Union[int, Sequence[int]] = 20,
+                    num_std: Union[float, Sequence[float]] = 2) -> pd.DataFrame:
+    """Bollinger Bands for several windows or several symbols; see rsi_sweep.
+
+    ``num_std`` is either shared or given per window/column.
+
+    Returns:
+        pd.DataFrame with two-level columns: ('bb_ma' | 'bb_upper' | 'bb_lower', window or symbol).
+    """
+    x, windows, keys = _sweep_inputs(prices, windows)
+    k = np.ascontiguousarray(np.broadcast_to(np.asarray(num_std, dtype=np.float64), windows.shape))
+    ma, upper, lower = _bb_2d_nb(x, windows.astype(np.int64), k)
+    return pd.concat({
+        "bb_ma": pd.DataFrame(ma, index=prices.index, columns=keys),
+        "bb_upper": pd.DataFrame(upper, index=prices.index, columns=keys),
+        "bb_lower": pd.DataFrame(lower, index=prices.index, columns=keys),
+    }, axis=1)
+
+
+def _bars_checksum(prices: pd.Series, crc: int = 0) -> int:
+    """CRC of per-bar (timestamp, close) hashes; extending ``crc`` with new bars equals hashing them all."""
+    return zlib.crc32(pd.util.hash_pandas_object(prices, index=True).to_numpy().tobytes(), crc)
+
+
+@dataclass
+class IndicatorState:
+    """Carry-over state for advancing indicators over newly appended bars.
+
+    A fresh state has seen no bars, so the ``*_update`` functions compute from scratch
+    on their first call. Each update function must be called with the same parameters
+    every time for a given state.
+    """
+    count: int = 0
+    checksum: int = 0
+    rsi: tuple = (np.nan, np.nan, 1.0, np.nan, 1.0)
+    macd: tuple = (np.nan, 1.0, np.nan, 1.0, np.nan, 1.0)
+    sma_tail: np.ndarray = field(default_factory=lambda: np.empty(0))
+    bb_tail: np.ndarray = field(default_factory=lambda: np.empty(0))
+
+    def resume_position(self, prices: pd.Series) -> Optional[int]:
+        """Position of the first bar in ``prices`` not yet folded into this state.
+
+        Returns None unless the first ``count`` bars of ``prices`` are exactly the bars
+        this state was built from (same timestamps and closes, nothing inserted or
+        revised); a fresh state is needed then. The check hashes the committed prefix,
+        which is vectorized and far cheaper than recomputing the indicators.
+        """
+        if self.count == 0 or len(prices) < self.count:
+            return None
+        if _bars_checksum(prices.iloc[:self.count]) != self.checksum:
+            return None
+        return self.count
+
+    def record(self, new_prices: pd.Series) -> None:
+        """Remember the bars in ``new_prices`` as folded into this state."""
+        if new_prices.empty:
+            return
+        self.checksum = _bars_checksum(new_prices, self.checksum)
+        self.count += len(new_prices)
+
+    def copy(self) -> "IndicatorState":
+        """Independent snapshot; the update functions rebind fields rather than mutate them."""
+        return replace(self)
+
+
+def _extend_tail(tail: np.ndarray, close: np.ndarray, keep: int):
+    """Prepend the carried tail to ``close``; return the joined array and the new tail."""
+    joined = np.concatenate((tail, close))
+    return joined, joined[max(len(joined) - keep, 0):].copy()
+
+
+def rsi_update(state: IndicatorState, new_closes: np.ndarray, period: int = 14) -> np.ndarray:
+    """Advance RSI over ``new_closes`` and return their RSI values."""
+    out, state.rsi = _rsi_run(new_closes, period, *state.rsi)
+    return out
+
+
+def macd_update(state: IndicatorState, new_closes: np.ndarray, fast: int = 12, slow: int = 26,
+                signal: int = 9) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Advance MACD over ``new_closes`` and return their (macd, signal, hist) values."""
+    out, state.macd = _macd_run(new_closes, 2.0 / (fast + 1), 2.0 / (slow + 1), 2.0 / (signal + 1), *state.macd)
+    return out
+
+
+def sma_update(state: IndicatorState, new_closes: np.ndarray, short_window: int = 9,
+               long_window: int = 21) -> Tuple[np.ndarray, np.ndarray]:
+    """Advance the short/long SMAs over ``new_closes``; only the last window of history is rescanned."""
+    joined, state.sma_tail = _extend_tail(state.sma_tail, new_closes, max(short_window, long_window) - 1)
+    skip = len(joined) - len(new_closes)
+    sma_short, sma_long = _sma_pair(joined, short_window, long_window)
+    return sma_short[skip:], sma_long[skip:]
+
+
+def bb_update(state: IndicatorState, new_closes: np.ndarray, window: int = 20,
+              num_std: int = 2) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Advance Bollinger Bands over ``new_closes``; only the last window of history is rescanned."""
+    joined, state.bb_tail = _extend_tail(state.bb_tail, new_closes, window - 1)
+    skip = len(joined) - len(new_closes)
+    ma, upper, lower = _bb_nb(joined, window, float(num_std))
+    return ma[skip:], upper[skip:], lower[skip:]
+
+
+INDICATOR_COLUMNS = ["rsi", "macd", "signal", "hist", "sma_short", "sma_long", "bb_ma", "bb_upper", "bb_lower"]
+
+
+def _fold(state: IndicatorState, new_prices: pd.Series, out: np.ndarray) -> None:
+    """Advance ``state`` over ``new_prices``, writing one row per bar into ``out`` (INDICATOR_COLUMNS order)."""
+    close = _as_float_array(new_prices)
+    out[:, 0] = rsi_update(state, close)
+    out[:, 1], out[:, 2], out[:, 3] = macd_update(state, close)
+    out[:, 4], out[:, 5] = sma_update(state, close)
+    out[:, 6], out[:, 7], out[:, 8] = bb_update(state, close)
+    state.record(new_prices)
+
+
+def update_indicators(state: IndicatorState, new_prices: pd.Series) -> pd.DataFrame:
+    """Compute all indicators (default parameters) for bars appended since ``state`` was last advanced.
+
+    Returns a DataFrame indexed like ``new_prices`` with the rsi, MACD, SMA and
+    Bollinger Band columns produced by the batch functions.
+    """
+    out = np.empty((len(new_prices), len(INDICATOR_COLUMNS)))
+    _fold(state, new_prices, out)
+    return pd.DataFrame(out, index=new_prices.index, columns=INDICATOR_COLUMNS)
+
+
+class IndicatorStream:
+    """Indicator frame for a price history that grows by appended bars.
+
+    The last bar is treated as live: it is folded into a throwaway copy of the state,
+    so a revised close only re-folds that one bar. Rows live in a preallocated buffer
+    that grows geometrically, so an update costs O(new bars) instead of re-concatenating
+    the whole frame. Any other change to the history (different first bar, inserted
+    or revised earlier bars) falls back to a full computation.
+    """
+
+    def __init__(self):
+        self._state = IndicatorState()
+        self._buf = np.empty((0, len(INDICATOR_COLUMNS)))
+
+    def update(self, prices: pd.Series) -> pd.DataFrame:
+        """Return indicators for ``prices``, computing only bars not already folded in.
+
+        The returned frame is a view of the internal buffer; it stays valid until the
+        next call, which may rewrite the live last row.
+        """
+        start = self._state.resume_position(prices)
+        if start is None:
+            self._state = IndicatorState()
+            start = 0
+        n = len(prices)
+        if n > len(self._buf):
+            grown = np.empty((max(n, 2 * len(self._buf)), len(INDICATOR_COLUMNS)))
+            grown[:start] = self._buf[:start]
+            self._buf = grown
+        if start < n:
+            # all but the live bar are committed; the live bar is folded into a snapshot
+            _fold(self._state, prices.iloc[start:n - 1], self._buf[start:n - 1])
+            _fold(self._state.copy(), prices.iloc[n - 1:], self._buf[n - 1:n])
+        return pd.DataFrame(self._buf[:n], index=prices.index, columns=INDICATOR_COLUMNS, copy=False)
+
+
+def _crossover_signs(d: np.ndarray) -> np.ndarray:
+    """+1 where ``d`` turns from negative to positive, -1 for the reverse, 0 elsewhere."""
+    out = np.zeros(len(d), dtype=np.int8)
+    out[1:][(d[:-1] < 0) & (d[1:] > 0)] = 1
+    out[1:][(d[:-1] > 0) & (d[1:] < 0)] = -1
+    return out
+
+
+def macd_crossovers(df: pd.DataFrame) -> pd.Series:
+    """Mark MACD/signal crossovers on every bar in one vectorized step.
+
+    Returns pd.Series aligned to ``df.index``: 1 where the MACD line crossed above the
+    signal line on that bar, -1 where it crossed below, 0 otherwise. Bullish bars are
+    ``np.flatnonzero(result > 0)``, which is what a backtest over all bars needs.
+    """
+    d = df["macd"].to_numpy(dtype=np.float64) - df["signal"].to_numpy(dtype=np.float64)
+    return pd.Series(_crossover_signs(d), index=df.index)
+
+
+_SIGNAL_COLUMNS = ["close", "rsi", "macd", "signal", "sma_short", "sma_long", "bb_lower", "bb_upper"]
+_CLOSE, _RSI, _MACD, _SIGNAL, _SMA_SHORT, _SMA_LONG, _BB_LOWER, _BB_UPPER = range(len(_SIGNAL_COLUMNS))
 
 
 def generate_simple_signal(df: pd.DataFrame) -> str:
@@ -72,18 +525,26 @@ def generate_simple_signal(df: pd.DataFrame) -> str:
     - Inputs: DataFrame with columns 'close', and optionally 'rsi', 'macd', 'signal', 'sma_short', 'sma_long', 'bb_lower', 'bb_upper'
     - Output: one of 'BUY', 'SELL', 'HOLD' and reason string
     """
-    close = df["close"].iloc[-1]
-    rsi_val = df["rsi"].iloc[-1] if "rsi" in df.columns else 50
-    macd_val = df["macd"].iloc[-1] if "macd" in df.columns else 0
-    signal_val = df["signal"].iloc[-1] if "signal" in df.columns else 0
-    sma_short = df["sma_short"].iloc[-1] if "sma_short" in df.columns else close
-    sma_long = df["sma_long"].iloc[-1] if "sma_long" in df.columns else close
+    pos = df.columns.get_indexer(_SIGNAL_COLUMNS)
+    has = pos >= 0
+    if not has[_CLOSE]:
+        raise KeyError("close")
+    # Read the last two rows of the needed columns once instead of per-column .iloc lookups
+    rows = np.full((2, len(_SIGNAL_COLUMNS)), np.nan)
+    tail = df.iloc[-2:, pos[has]].to_numpy(dtype=np.float64)
+    rows[2 - len(tail):, has] = tail
+    prev, last = rows
+
+    close = last[_CLOSE]
+    rsi_val = last[_RSI]
+    sma_short = last[_SMA_SHORT]
+    sma_long = last[_SMA_LONG]
 
     reasons = []
     score = 0
 
     # RSI rules
-    if "rsi" in df.columns:
+    if has[_RSI]:
         if rsi_val < 30:
             score += 1
             reasons.append(f"RSI is low ({rsi_val:.1f}), indicating oversold.")
@@ -92,18 +553,17 @@ def generate_simple_signal(df: pd.DataFrame) -> str:
             reasons.append(f"RSI is high ({rsi_val:.1f}), indicating overbought.")
 
     # MACD crossover
-    if {"macd", "signal"}.issubset(df.columns) and len(df) >= 2:
-        macd_prev_signal_prev = df["macd"].iloc[-2] - df["signal"].iloc[-2]
-        macd_curr_signal_curr = macd_val - signal_val
-        if macd_prev_signal_prev < 0 and macd_curr_signal_curr > 0:
+    if has[_MACD] and has[_SIGNAL] and len(df) >= 2:
+        cross = _crossover_signs(rows[:, _MACD] - rows[:, _SIGNAL])[-1]
+        if cross > 0:
             score += 1.5  # Strong signal
             reasons.append("MACD line crossed above the signal line (bullish crossover).")
-        elif macd_prev_signal_prev > 0 and macd_curr_signal_curr < 0:
+        elif cross < 0:
             score -= 1.5  # Strong signal
             reasons.append("MACD line crossed below the signal line (bearish crossover).")
 
     # SMA trend
-    if {"sma_short", "sma_long"}.issubset(df.columns):
+    if has[_SMA_SHORT] and has[_SMA_LONG]:
         if sma_short > sma_long:
             score += 0.5
             reasons.append("Short-term moving average is above the long-term (uptrend).")
@@ -112,11 +572,11 @@ def generate_simple_signal(df: pd.DataFrame) -> str:
             reasons.append("Short-term moving average is below the long-term (downtrend).")
 
     # Bollinger Bands
-    if {"bb_lower", "bb_upper"}.issubset(df.columns):
-        if close < df["bb_lower"].iloc[-1]:
+    if has[_BB_LOWER] and has[_BB_UPPER]:
+        if close < last[_BB_LOWER]:
             score += 1
             reasons.append("Price is below the lower Bollinger Band (potential bounce).")
-        elif close > df["bb_upper"].iloc[-1]:
+        elif close > last[_BB_UPPER]:
             score -= 1
             reasons.append("Price is above the upper Bollinger Band (potential pullback).")
 
@@ -130,3 +590,17 @@ def generate_simple_signal(df: pd.DataFrame) -> str:
         return "SELL", "; ".join(reasons)
     else:
         return "HOLD", "; ".join(reasons)
+
+
+def _warm_up() -> None:
+    """Compile (or load from Numba's on-disk cache) the kernels the app calls.
+
+    Runs at import so the first Streamlit render does not pay the JIT latency. The app
+    goes through IndicatorStream only, for both float dtypes the data providers produce;
+    the memoized batch wrappers compile lazily on first use.
+    """
+    for dtype in (np.float64, np.float32):
+        IndicatorStream().update(pd.Series(np.linspace(1.0, 2.0, 32, dtype=dtype)))
+
+
+_warm_up()
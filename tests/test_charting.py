@@ -0,0 +1,23 @@
+import numpy as np
+import pandas as pd
+from charting import lttb_indices, line_trace
+
+
+def test_lttb_keeps_endpoints_and_spikes():
+    y = np.zeros(1000)
+    y[537] = 50.0
+    idx = lttb_indices(np.arange(1000), y, 50)
+    assert len(idx) == 50
+    assert idx[0] == 0 and idx[-1] == 999
+    assert np.all(np.diff(idx) > 0)
+    assert 537 in idx
+
+
+def test_line_trace_downsamples_long_series():
+    index = pd.date_range("2024-01-01", periods=20000, freq="min")
+    series = pd.Series(np.sin(np.arange(20000) / 100.0), index=index)
+    series.iloc[:30] = np.nan
+    trace = line_trace(series, max_points=500, name="x")
+    assert len(trace.y) == 500
+    assert not np.isnan(trace.y).any()
+    assert len(line_trace(series.iloc[:100], max_points=500).y) == 100
@@ -1,6 +1,7 @@
 import pandas as pd
 import numpy as np
-from indicators import rsi, macd
+from indicators import rsi, macd, moving_averages, bollinger_bands, IndicatorState, IndicatorStream, update_indicators, generate_simple_signal
+from indicators import rsi_sweep, sma_sweep, bollinger_sweep, macd_crossovers
 
 
 def test_rsi_basic():
@@ -15,3 +16,191 @@ def test_macd_basic():
     m = macd(prices)
     assert set(["macd","signal","hist"]).issubset(m.columns)
     assert len(m) == len(prices)
+
+
+def test_rsi_matches_pandas_ewm():
+    rng = np.random.default_rng(0)
+    prices = pd.Series(100 + rng.standard_normal(300).cumsum())
+    prices.iloc[[50, 51, 120]] = np.nan
+    delta = prices.diff()
+    ma_up = delta.clip(lower=0).ewm(com=13, adjust=False).mean()
+    ma_down = (-delta.clip(upper=0)).ewm(com=13, adjust=False).mean()
+    expected = 100 - (100 / (1 + ma_up / ma_down))
+    pd.testing.assert_series_equal(rsi(prices, period=14), expected, check_names=False)
+
+
+def test_macd_matches_pandas_ewm():
+    rng = np.random.default_rng(1)
+    prices = pd.Series(100 + rng.standard_normal(300).cumsum())
+    prices.iloc[[0, 80, 81]] = np.nan
+    ema_fast = prices.ewm(span=12, adjust=False).mean()
+    ema_slow = prices.ewm(span=26, adjust=False).mean()
+    macd_line = ema_fast - ema_slow
+    signal_line = macd_line.ewm(span=9, adjust=False).mean()
+    m = macd(prices)
+    pd.testing.assert_series_equal(m["macd"], macd_line, check_names=False)
+    pd.testing.assert_series_equal(m["signal"], signal_line, check_names=False)
+    pd.testing.assert_series_equal(m["hist"], macd_line - signal_line, check_names=False)
+
+
+def test_bollinger_bands_match_pandas_rolling():
+    rng = np.random.default_rng(2)
+    prices = pd.Series(2500 + rng.standard_normal(500).cumsum())
+    prices.iloc[[100, 230]] = np.nan
+    mean = prices.rolling(window=20).mean()
+    std = prices.rolling(window=20).std()
+    bb = bollinger_bands(prices, window=20, num_std=2)
+    pd.testing.assert_series_equal(bb["bb_ma"], mean, check_names=False)
+    pd.testing.assert_series_equal(bb["bb_upper"], mean + 2 * std, check_names=False)
+    pd.testing.assert_series_equal(bb["bb_lower"], mean - 2 * std, check_names=False)
+
+
+def test_indicator_results_are_cached_but_independent():
+    prices = pd.Series(np.linspace(1, 50, 60))
+    first = rsi(prices)
+    first.iloc[-1] = -1.0
+    second = rsi(prices.copy())
+    assert second.iloc[-1] == 100.0
+
+    sma = moving_averages(prices, short_window=3, long_window=5)
+    expected = prices.rolling(window=5, min_periods=1).mean()
+    pd.testing.assert_series_equal(sma["sma_long"], expected, check_names=False)
+
+
+def test_update_indicators_matches_batch_computation():
+    rng = np.random.default_rng(3)
+    prices = pd.Series(100 + rng.standard_normal(200).cumsum(),
+                       index=pd.date_range("2024-01-01", periods=200, freq="D"))
+    state = IndicatorState()
+    head = update_indicators(state, prices.iloc[:150])
+    assert state.resume_position(prices) == 150
+    tail = update_indicators(state, prices.iloc[150:])
+    streamed = pd.concat([head, tail])
+
+    expected = pd.concat([rsi(prices).rename("rsi"), macd(prices), moving_averages(prices),
+                          bollinger_bands(prices)], axis=1)
+    pd.testing.assert_frame_equal(streamed, expected[streamed.columns], check_freq=False)
+
+
+def test_resume_position_rejects_revised_history():
+    prices = pd.Series(np.linspace(1, 30, 30), index=pd.date_range("2024-01-01", periods=30, freq="D"))
+    state = IndicatorState()
+    update_indicators(state, prices.iloc[:20])
+    revised = prices.copy()
+    revised.iloc[19] += 1
+    assert state.resume_position(revised) is None
+    assert state.resume_position(prices.iloc[5:]) is None
+
+
+def test_generate_simple_signal_bullish_crossover():
+    df = pd.DataFrame({
+        "close": [10.0, 9.0],
+        "rsi": [35.0, 25.0],
+        "macd": [-1.0, 1.0],
+        "signal": [0.0, 0.0],
+        "sma_short": [9.0, 9.5],
+        "sma_long": [10.0, 9.0],
+    })
+    suggestion, reason = generate_simple_signal(df)
+    assert suggestion == "BUY"
+    assert "bullish crossover" in reason
+    assert "uptrend" in reason
+
+
+def test_generate_simple_signal_without_indicators():
+    assert generate_simple_signal(pd.DataFrame({"close": [1.0]}))[0] == "HOLD"
+
+
+def test_indicators_accept_float32_prices():
+    rng = np.random.default_rng(4)
+    prices = pd.Series(100 + rng.standard_normal(200).cumsum())
+    narrow = prices.astype(np.float32)
+    np.testing.assert_allclose(rsi(narrow), rsi(narrow.astype(np.float64)), rtol=1e-9, equal_nan=True)
+    np.testing.assert_allclose(macd(narrow), macd(narrow.astype(np.float64)), rtol=1e-9, equal_nan=True)
+    np.testing.assert_allclose(bollinger_bands(narrow), bollinger_bands(narrow.astype(np.float64)),
+                               rtol=1e-9, equal_nan=True)
+
+
+def test_moving_averages_match_pandas_rolling():
+    rng = np.random.default_rng(5)
+    prices = pd.Series(2500 + rng.standard_normal(300).cumsum())
+    prices.iloc[[10, 11, 150]] = np.nan
+    sma = moving_averages(prices, short_window=9, long_window=21)
+    for col, window in (("sma_short", 9), ("sma_long", 21)):
+        expected = prices.rolling(window=window, min_periods=1).mean()
+        pd.testing.assert_series_equal(sma[col], expected, check_names=False)
+
+
+def test_sweeps_match_single_parameter_results():
+    rng = np.random.default_rng(6)
+    prices = pd.Series(100 + rng.standard_normal(250).cumsum())
+
+    rsis = rsi_sweep(prices, [7, 14, 21])
+    for period in (7, 14, 21):
+        pd.testing.assert_series_equal(rsis[period], rsi(prices, period=period), check_names=False)
+
+    smas = sma_sweep(prices, [5, 50])
+    pd.testing.assert_series_equal(smas[50], moving_averages(prices, 5, 50)["sma_long"], check_names=False)
+
+    bands = bollinger_sweep(prices, [10, 20], num_std=[1.5, 2])
+    expected = bollinger_bands(prices, window=20, num_std=2)
+    pd.testing.assert_series_equal(bands[("bb_upper", 20)], expected["bb_upper"], check_names=False)
+
+    symbols = pd.DataFrame({"A": prices, "B": prices * 2})
+    per_symbol = rsi_sweep(symbols, 14)
+    assert list(per_symbol.columns) == ["A", "B"]
+    pd.testing.assert_series_equal(per_symbol["B"], rsi(prices * 2), check_names=False)
+
+
+def test_macd_crossovers_marks_every_cross():
+    df = pd.DataFrame({"macd": [-1.0, 1.0, 2.0, 0.0, -1.0, 1.0], "signal": [0.0] * 6})
+    assert macd_crossovers(df).tolist() == [0, 1, 0, 0, 0, 1]
+    df["macd"] = [1.0, -1.0, -2.0, 1.0, 1.0, -3.0]
+    assert macd_crossovers(df).tolist() == [0, -1, 0, 1, 0, -1]
+
+
+def test_indicator_stream_refolds_only_the_live_bar():
+    rng = np.random.default_rng(7)
+    prices = pd.Series(100 + rng.standard_normal(120).cumsum(),
+                       index=pd.date_range("2024-01-01", periods=120, freq="D"))
+
+    def batch(p):
+        return pd.concat([rsi(p).rename("rsi"), macd(p), moving_averages(p), bollinger_bands(p)], axis=1)
+
+    stream = IndicatorStream()
+    stream.update(prices.iloc[:100])
+    revised = prices.iloc[:101].copy()
+    revised.iloc[99] += 5  # live bar revised, then a new bar appended
+    assert stream._state.resume_position(revised) == 99
+    got = stream.update(revised)
+    expected = batch(revised)
+    pd.testing.assert_frame_equal(got, expected[got.columns], check_freq=False)
+
+    got = stream.update(prices)  # earlier bar differs again: full recompute
+    pd.testing.assert_frame_equal(got, batch(prices)[got.columns], check_freq=False)
+
+
+def test_indicator_stream_recomputes_after_backfill_or_mid_history_revision():
+    rng = np.random.default_rng(8)
+    index = pd.date_range("2024-01-01", periods=121, freq="h")
+    full = pd.Series(100 + rng.standard_normal(121).cumsum(), index=index)
+
+    def batch(p):
+        return pd.concat([rsi(p).rename("rsi"), macd(p), moving_averages(p), bollinger_bands(p)], axis=1)
+
+    # a bar missing from the first fetch shows up later, shifting every following bar
+    stream = IndicatorStream()
+    stream.update(full.drop(index[50]).iloc[:100])
+    backfilled = full.iloc[:102]
+    assert stream._state.resume_position(backfilled) is None
+    got = stream.update(backfilled)
+    pd.testing.assert_frame_equal(got, batch(backfilled)[got.columns], check_freq=False)
+
+    # same bar count and endpoints, but a middle close was corrected
+    stream = IndicatorStream()
+    stream.update(full.iloc[:100])
+    revised = full.iloc[:101].copy()
+    revised.iloc[40] += 10
+    assert stream._state.resume_position(revised) is None
+    got = stream.update(revised)
+    pd.testing.assert_frame_equal(got, batch(revised)[got.columns], check_freq=False)
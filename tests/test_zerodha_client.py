@@ -0,0 +1,58 @@
+import zerodha_client
+from zerodha_client import ZerodhaClient
+
+
+class FakeKite:
+    def __init__(self):
+        self.instrument_calls = 0
+
+    def instruments(self, exchange):
+        self.instrument_calls += 1
+        return [
+            {"tradingsymbol": "INFY", "instrument_token": 408065},
+            {"tradingsymbol": "RELIANCE", "instrument_token": 738561},
+        ]
+
+
+def make_client():
+    client = ZerodhaClient.__new__(ZerodhaClient)
+    client.kite = FakeKite()
+    client._instrument_map = None
+    return client
+
+
+def test_instrument_map_is_cached_on_disk(tmp_path, monkeypatch):
+    monkeypatch.setenv("ZERODHA_CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(zerodha_client, "_instrument_maps", {})
+
+    first = make_client()
+    assert first.get_instrument_token("reliance") == 738561
+    assert first.get_instrument_token("UNKNOWN") is None
+    assert first.kite.instrument_calls == 1
+
+    # a new process starts with an empty in-memory cache but finds the disk copy
+    monkeypatch.setattr(zerodha_client, "_instrument_maps", {})
+    second = make_client()
+    assert second.get_instrument_token("INFY") == 408065
+    assert second.kite.instrument_calls == 0
+
+
+def test_get_historical_builds_typed_frame(tmp_path, monkeypatch):
+    import datetime as dt
+    monkeypatch.setenv("ZERODHA_CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(zerodha_client, "_instrument_maps", {})
+    ist = dt.timezone(dt.timedelta(hours=5, minutes=30))
+    candles = [
+        {"date": dt.datetime(2024, 1, d, 9, 15, tzinfo=ist), "open": 10.0 + d, "high": 11.0 + d,
+         "low": 9.0 + d, "close": 10.5 + d, "volume": 1000 * d}
+        for d in (1, 2, 3)
+    ]
+    client = make_client()
+    client.kite.historical_data = lambda token, start, end, interval: candles
+
+    df = client.get_historical("INFY", "2024-01-01", "2024-01-04")
+    assert list(df.columns) == ["open", "high", "low", "close", "volume"]
+    assert df.index.name == "date" and df.index.tz is None
+    assert df.index[0] == dt.datetime(2024, 1, 1, 9, 15)
+    assert df["close"].dtype == "float32"
+    assert df["volume"].tolist() == [1000, 2000, 3000]
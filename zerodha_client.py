@@ -4,8 +4,11 @@ Simple Zerodha (Kite Connect) wrapper.
 This module provides a minimal wrapper for fetching historical data using KiteConnect.
 It contains placeholder instructions — the user must set API keys and generate an access token.
 """
-from typing import Optional
+from typing import Dict, Optional, Tuple
+import json
 import os
+import time
+import numpy as np
 import pandas as pd
 
 try:
@@ -13,6 +16,43 @@ try:
 except Exception:
     KiteConnect = None  # graceful fallback if package not installed
 
+# Zerodha publishes the instrument dump once a day, so a day-old copy is still valid
+INSTRUMENT_CACHE_TTL = 24 * 3600
+
+# exchange -> (fetched_at, {tradingsymbol: instrument_token}); shared by all clients in the process
+_instrument_maps: Dict[str, Tuple[float, Dict[str, int]]] = {}
+
+
+def _instrument_cache_path(exchange: str) -> str:
+    cache_dir = os.getenv("ZERODHA_CACHE_DIR") or os.path.join(os.path.expanduser("~"), ".cache", "tradebot")
+    return os.path.join(cache_dir, f"instruments_{exchange}.json")
+
+
+def _load_instrument_map(exchange: str) -> Optional[Tuple[float, Dict[str, int]]]:
+    """Read the on-disk instrument map if it is younger than INSTRUMENT_CACHE_TTL."""
+    path = _instrument_cache_path(exchange)
+    try:
+        fetched_at = os.path.getmtime(path)
+        if time.time() - fetched_at >= INSTRUMENT_CACHE_TTL:
+            return None
+        with open(path, "r", encoding="utf-8") as f:
+            return fetched_at, json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _store_instrument_map(exchange: str, mapping: Dict[str, int]) -> None:
+    """Persist the instrument map; the disk cache is best effort, so write errors are ignored."""
+    path = _instrument_cache_path(exchange)
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(mapping, f)
+        os.replace(tmp_path, path)
+    except OSError:
+        pass
+
 
 class ZerodhaClient:
     def __init__(self, api_key: Optional[str] = None, api_secret: Optional[str] = None, access_token: Optional[str] = None):
@@ -30,21 +70,25 @@ class ZerodhaClient:
         if access_token:
             self.kite.set_access_token(access_token)
         
-        self._instruments = None
+        self._instrument_map = None
 
-    def _fetch_instruments(self, exchange="NSE"):
-        """Fetch instruments and cache them."""
-        if self._instruments is None:
-            self._instruments = self.kite.instruments(exchange)
+    def _fetch_instruments(self, exchange="NSE") -> Dict[str, int]:
+        """Return the {tradingsymbol: instrument_token} map, cached in memory and on disk for a day."""
+        cached = _instrument_maps.get(exchange)
+        if cached is None or time.time() - cached[0] >= INSTRUMENT_CACHE_TTL:
+            cached = _load_instrument_map(exchange)
+            if cached is None:
+                instruments = self.kite.instruments(exchange)
+                mapping = {row["tradingsymbol"]: row["instrument_token"] for row in instruments}
+                _store_instrument_map(exchange, mapping)
+                cached = (time.time(), mapping)
+            _instrument_maps[exchange] = cached
+        self._instrument_map = cached[1]
+        return self._instrument_map
 
     def get_instrument_token(self, symbol: str, exchange: str = "NSE") -> Optional[int]:
         """Find instrument token for a given symbol."""
-        self._fetch_instruments(exchange)
-        if self._instruments:
-            for instrument in self._instruments:
-                if instrument['tradingsymbol'] == symbol.upper():
-                    return instrument['instrument_token']
-        return None
+        return self._fetch_instruments(exchange).get(symbol.upper())
 
     def get_historical(self, symbol: str, from_date: str, to_date: str, interval: str = "day", exchange: str = "NSE") -> pd.DataFrame:
         """Fetch historical OHLC data using KiteConnect.historical_data.
@@ -52,20 +96,39 @@ class ZerodhaClient:
         Automatically looks up instrument token for the given symbol.
         Parameters should be in the format accepted by KiteConnect (dates in YYYY-MM-DD HH:MM:SS or YYYY-MM-DD).
 
-        Returns pandas DataFrame with columns: ['date','open','high','low','close','volume']
+        Returns pandas DataFrame indexed by 'date' with columns: ['open','high','low','close','volume']
         """
         instrument_token = self.get_instrument_token(symbol, exchange)
         if not instrument_token:
             raise ValueError(f"Could not find instrument token for symbol {symbol} on exchange {exchange}.")
             
         data = self.kite.historical_data(instrument_token, from_date, to_date, interval)
-        df = pd.DataFrame(data)
-        if not df.empty and "date" in df.columns:
-            df = df.set_index(pd.to_datetime(df["date"]))
-            # Ensure timezone is removed for consistency
-            df.index = df.index.tz_localize(None)
-        return df
+        # Split the list of candle dicts into columns in one pass; building the frame from
+        # typed arrays skips pandas' per-row inference and the set_index copy.
+        n = len(data)
+        dates = [None] * n
+        opens = [0.0] * n
+        highs = [0.0] * n
+        lows = [0.0] * n
+        closes = [0.0] * n
+        volumes = [0] * n
+        for i, candle in enumerate(data):
+            dates[i] = candle["date"]
+            opens[i] = candle["open"]
+            highs[i] = candle["high"]
+            lows[i] = candle["low"]
+            closes[i] = candle["close"]
+            volumes[i] = candle["volume"]
+        # Ensure timezone is removed for consistency
+        index = pd.DatetimeIndex(pd.to_datetime(dates), name="date").tz_localize(None)
+        return pd.DataFrame({
+            "open": np.asarray(opens, dtype=np.float32),
+            "high": np.asarray(highs, dtype=np.float32),
+            "low": np.asarray(lows, dtype=np.float32),
+            "close": np.asarray(closes, dtype=np.float32),
+            "volume": np.asarray(volumes, dtype=np.int64),
+        }, index=index)
 
 
-# NOTE: KiteConnect uses instrument tokens for exchanges; the mapping from tradingsymbol to token is out of scope here.
-# See KiteConnect docs for instrument token list and login/access-token generation flow.
+# NOTE: tradingsymbol -> instrument_token lookups use the cached instrument dump (see _fetch_instruments).
+# See KiteConnect docs for the login/access-token generation flow.